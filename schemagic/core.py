@@ -1,12 +1,14 @@
-import collections
-from functools import partial
-import types
-
 import itertools
 
-from schemagic.utils import merge_with, multiple_dispatch_fn, is_string
+try:
+    import numpy as _numpy
+except ImportError:  # numpy is optional - without it sequence templates just stay pure python
+    _numpy = None
+
+from schemagic.utils import is_string
 
-_WHEN_DEBUGGING = lambda: __debug__
+# __debug__ is fixed at interpreter startup, so resolve it once instead of per call
+_WHEN_DEBUGGING = (lambda: True) if __debug__ else (lambda: False)
 
 
 def validate_map_template(schema, value):
@@ -18,10 +20,9 @@ def validate_map_template(schema, value):
     :param value: Any data which will be checked to make sure it matches the prescribed pattern
     :return: The data after it has been run through its validators.
     """
-    key_schema, value_schema = list(schema.items())[0]
-    validate_key_val_pair = lambda key, val: (
-    validate_against_schema(key_schema, key), validate_against_schema(value_schema, val))
-    return dict(map(validate_key_val_pair, value.keys(), value.values()))
+    key_schema, value_schema = next(iter(schema.items()))
+    return {validate_against_schema(key_schema, key): validate_against_schema(value_schema, val)
+            for key, val in value.items()}
 
 
 def validate_keyed_mapping(schema, value):
@@ -33,10 +34,14 @@ def validate_keyed_mapping(schema, value):
     :param value: Any data which will be checked to make sure it matches the prescribed pattern
     :return: The data after it has been run through its validators.
     """
-    missing_keys = set(schema.keys()) - set(value.keys())
+    missing_keys = schema.keys() - value.keys()
     if missing_keys:
         raise ValueError("Missing keys {0} for value {1}".format(missing_keys, value))
-    return merge_with(validate_against_schema, schema, value)
+    validated = {key: validate_against_schema(sub_schema, value[key]) for key, sub_schema in schema.items()}
+    for key in value:
+        if key not in validated:
+            validated[key] = value[key]
+    return validated
 
 
 def validate_sequence_template(schema, value):
@@ -48,7 +53,14 @@ def validate_sequence_template(schema, value):
     :param value: Any data which will be checked to make sure it matches the prescribed pattern
     :return: The data after it has been run through its validators.
     """
-    return list(map(validate_against_schema, itertools.repeat(schema[0], len(value)), value))
+    element_schema = schema[0]
+    if (_numpy is not None and type(value) is list and len(value) >= _VECTORIZE_MIN_LENGTH
+            and type(element_schema) is type and element_schema in _VECTORIZABLE_DTYPES):
+        try:
+            return _numpy.asarray(value, _VECTORIZABLE_DTYPES[element_schema]).tolist()
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return [validate_against_schema(element_schema, element) for element in value]
 
 
 def validate_strict_sequence(schema, value):
@@ -64,22 +76,178 @@ def validate_strict_sequence(schema, value):
         raise ValueError(
             "sequence has a different number of elements than its schema prescribes.  value: {0}, schema: {1}".format(
                 value, schema))
-    return list(map(validate_against_schema, schema, value))
-
-
-_is_map_template = lambda schema: isinstance(schema, collections.MutableMapping) and len(schema.items()) is 1 and not is_string(list(schema.keys())[0])
-_is_keyed_mapping = lambda schema: isinstance(schema, collections.MutableMapping) and not _is_map_template(schema)
-_is_sequence_template = lambda schema: isinstance(schema, collections.Sequence) and len(schema) is 1
-_is_strict_sequence = lambda schema: isinstance(schema, collections.Sequence) and 1 < len(schema)
-
-_validate_against_schema = multiple_dispatch_fn({
-    lambda schema, value: _is_sequence_template(schema): validate_sequence_template,
-    lambda schema, value: _is_strict_sequence(schema): validate_strict_sequence,
-    lambda schema, value: _is_map_template(schema): validate_map_template,
-    lambda schema, value: _is_keyed_mapping(schema): validate_keyed_mapping},
-    default=lambda schema, value: schema(value))
-validate_against_schema = lambda schema, value: _validate_against_schema(schema, value)
-validate_against_schema.__doc__ = \
+    return [validate_against_schema(element_schema, element) for element_schema, element in zip(schema, value)]
+
+
+#: compiled validators keyed by ``id(schema)``.  Each entry holds a strong reference to the schema
+#: itself alongside its validator, so a recycled id can never collide with a live schema.
+_validator_cache = {}
+
+_EMITTABLE_KEY_TYPES = (str, int, float, bool, type(None))
+
+#: primitive leaf schemas whose sequence-template validation can be handed to numpy wholesale.
+#: str is deliberately absent - numpy's string handling does not match python's.
+_VECTORIZABLE_DTYPES = {int: _numpy.int64, float: _numpy.float64, bool: _numpy.bool_} if _numpy else {}
+
+#: below this length the cost of crossing into numpy outweighs the C loop it buys
+_VECTORIZE_MIN_LENGTH = 64
+
+# A numba @njit rung above the numpy path was considered and rejected: compiled validators
+# build dicts/lists of arbitrary python objects and call arbitrary python callables, none of
+# which nopython mode supports, and the purely numeric flat case is already a single C loop
+# through numpy.asarray above.
+
+
+def _emit_constant(constant, namespace, counter):
+    """Returns a source fragment that evaluates to ``constant`` inside the compiled function.
+
+    Simple literals are written directly into the emitted source.  Anything fancier (type objects,
+    custom validators used as mapping keys, etc.) is pushed into the compiled function's globals
+    and referenced by name.
+    """
+    if isinstance(constant, _EMITTABLE_KEY_TYPES):
+        return repr(constant)
+    name = "_const_{0}".format(next(counter))
+    namespace[name] = constant
+    return name
+
+
+def _compile_node(schema, source_lines, namespace, counter, emitted_nodes):
+    """Emits the validator for a single schema node, returning the name it is bound to.
+
+    Container nodes become ``def`` statements appended to ``source_lines``; callable leaves are
+    simply bound into ``namespace`` so the emitted source can call them directly.  Container nodes
+    already present in the validator cache are not recompiled - the cached function is bound into
+    ``namespace`` and reused, so shared subschemas cost a single dict lookup.
+
+    Nodes are classified with an inline ``type(schema) is dict``/``is list``/``is tuple`` chain -
+    a single pointer compare in the common case - falling back to a concrete ``isinstance`` check
+    only for dict/list/tuple subclasses such as OrderedDict.
+    """
+    name = "_validate_{0}".format(next(counter))
+    cache_entry = _validator_cache.get(id(schema))
+    if cache_entry is not None and cache_entry[0] is schema:
+        namespace[name] = cache_entry[1]
+        return name
+    schema_type = type(schema)
+    is_mapping = schema_type is dict or isinstance(schema, dict)
+    is_sequence = not is_mapping and (
+        schema_type is list or schema_type is tuple or isinstance(schema, (list, tuple)))
+    if is_mapping and len(schema) == 1 and not is_string(next(iter(schema))):
+        key_schema, value_schema = next(iter(schema.items()))
+        key_validator = _compile_node(key_schema, source_lines, namespace, counter, emitted_nodes)
+        value_validator = _compile_node(value_schema, source_lines, namespace, counter, emitted_nodes)
+        source_lines.append(
+            "def {name}(value):\n"
+            "    return {{{key_validator}(key): {value_validator}(val) for key, val in value.items()}}\n".format(
+                name=name, key_validator=key_validator, value_validator=value_validator))
+    elif is_mapping:
+        validated_items = ", ".join(
+            "{key}: {sub_validator}(value[{key}])".format(
+                key=_emit_constant(key, namespace, counter),
+                sub_validator=_compile_node(sub_schema, source_lines, namespace, counter, emitted_nodes))
+            for key, sub_schema in schema.items())
+        if schema:
+            required_keys = "{0}_required_keys".format(name)
+            namespace[required_keys] = frozenset(schema)
+            missing_keys_check = (
+                "    if not {required_keys}.issubset(value.keys()):\n"
+                "        missing_keys = set({required_keys}.difference(value.keys()))\n"
+                "        raise ValueError(\"Missing keys {{0}} for value {{1}}\".format(missing_keys, value))\n"
+            ).format(required_keys=required_keys)
+        else:
+            missing_keys_check = ""
+        source_lines.append(
+            "def {name}(value):\n"
+            "{missing_keys_check}"
+            "    validated = {{{validated_items}}}\n"
+            "    for key in value:\n"
+            "        if key not in validated:\n"
+            "            validated[key] = value[key]\n"
+            "    return validated\n".format(name=name, missing_keys_check=missing_keys_check,
+                                            validated_items=validated_items))
+    elif is_sequence and len(schema) == 1:
+        element_schema = schema[0]
+        element_validator = _compile_node(element_schema, source_lines, namespace, counter, emitted_nodes)
+        if type(element_schema) is type and element_schema in _VECTORIZABLE_DTYPES:
+            dtype_name = "{0}_dtype".format(name)
+            namespace[dtype_name] = _VECTORIZABLE_DTYPES[element_schema]
+            namespace["_asarray"] = _numpy.asarray
+            source_lines.append(
+                "def {name}(value):\n"
+                "    if type(value) is list and len(value) >= {min_length}:\n"
+                "        try:\n"
+                "            return _asarray(value, {dtype_name}).tolist()\n"
+                "        except (TypeError, ValueError, OverflowError):\n"
+                "            pass\n"
+                "    return [{element_validator}(element) for element in value]\n".format(
+                    name=name, min_length=_VECTORIZE_MIN_LENGTH, dtype_name=dtype_name,
+                    element_validator=element_validator))
+        else:
+            source_lines.append(
+                "def {name}(value):\n"
+                "    return [{element_validator}(element) for element in value]\n".format(
+                    name=name, element_validator=element_validator))
+    elif is_sequence and len(schema) > 1:
+        schema_name = "{0}_schema".format(name)
+        namespace[schema_name] = schema
+        validated_elements = ", ".join(
+            "{element_validator}(value[{index}])".format(
+                element_validator=_compile_node(element_schema, source_lines, namespace, counter, emitted_nodes), index=index)
+            for index, element_schema in enumerate(schema))
+        source_lines.append(
+            "def {name}(value):\n"
+            "    if not len(value) == {arity}:\n"
+            "        raise ValueError(\n"
+            "            \"sequence has a different number of elements than its schema prescribes.  value: {{0}}, schema: {{1}}\".format(\n"
+            "                value, {schema_name}))\n"
+            "    return [{validated_elements}]\n".format(
+                name=name, arity=len(schema), schema_name=schema_name, validated_elements=validated_elements))
+    else:
+        namespace[name] = schema
+    if name not in namespace:
+        emitted_nodes.append((name, schema))
+    return name
+
+
+def compile_schema(schema):
+    """Compiles the schema into a single, flat python function that validates data against it.
+
+    The schema tree is walked exactly once, and each node is emitted as straight-line python
+    source - e.g. ``{"name": str, "age": int}`` roughly becomes
+    ``def check(value): return {'name': str(value['name']), 'age': int(value['age'])}``.
+    The source is then run through ``compile()``/``exec()``, so repeated validations pay for no
+    schema dispatch, predicate checks, or tree walking whatsoever.
+
+    :param schema: a data definition as described in the function ``validate_against_schema``
+    :return: a function of one argument that validates data the same way
+        ``validate_against_schema(schema, data)`` would.
+    """
+    source_lines = []
+    namespace = {}
+    emitted_nodes = []
+    entry_point = _compile_node(schema, source_lines, namespace, itertools.count(), emitted_nodes)
+    if source_lines:
+        exec(compile("\n".join(source_lines), "<schemagic.compile_schema>", "exec"), namespace)
+    for node_name, node_schema in emitted_nodes:
+        _validator_cache[id(node_schema)] = (node_schema, namespace[node_name])
+    return namespace[entry_point]
+
+
+def _get_compiled(schema):
+    """Returns the compiled validator for the schema, compiling and caching it on first sight.
+
+    Compilation registers every container node of the schema in the validator cache, so later
+    lookups - whether of this schema or of another schema sharing its subtrees - are a single
+    dict hit.
+    """
+    cache_entry = _validator_cache.get(id(schema))
+    if cache_entry is not None and cache_entry[0] is schema:
+        return cache_entry[1]
+    return compile_schema(schema)
+
+
+def validate_against_schema(schema, value):
     """Testing to ensure changes to docs are getting reflected in generated documentation
     Ensures that the data is valid with the given schema
 
@@ -112,10 +280,31 @@ validate_against_schema.__doc__ = \
     :param value: Any data which will be checked to make sure it matches the prescribed pattern
     :return: The data after it has been run through its validators.
     """
+    schema_type = type(schema)
+    if schema_type is not dict and schema_type is not list and schema_type is not tuple and callable(schema):
+        return schema(value)
+    return _get_compiled(schema)(value)
 
 
-def validator(schema, subject_name_str, validation_predicate=None, coerce_data=False, data=None):
-    """Creates a validation function which conditionally applies validation and coercion to data
+def _raise_validation_error(subject_name_str, data, schema, error):
+    """Cold path of ``make_validator``: formats and raises the descriptive validation error.
+
+    Lives outside the validation closure so the success path never touches the message
+    machinery.  The offending value's repr is bounded so enormous payloads don't turn error
+    construction into the slowest part of a failure.
+    """
+    value_repr = repr(data)
+    if len(value_repr) > 200:
+        value_repr = value_repr[:200] + "..."
+    raise ValueError("Bad value provided for {0}. - error: {1}: {2} schema: {3} value: {4}".format(
+        subject_name_str, error.__class__.__name__, error, schema, value_repr))
+
+
+def make_validator(schema, subject_name_str, validation_predicate=None, coerce_data=False):
+    """Builds a validation function which conditionally applies validation and coercion to data
+
+    All of the arguments are bound into a single closure up front - no ``partial`` is allocated
+    per curry level, and the schema is compiled exactly once, when the validator is built.
 
     :param schema: a data definition as described in the function ``validate_against_schema``
     :param subject_name_str:
@@ -134,6 +323,34 @@ def validator(schema, subject_name_str, validation_predicate=None, coerce_data=F
         ``validate_against_schema`` to the data, or simply return the original data.
         **NOTE**: if your validator applies functions that mutate their inputs, the data may be altered regardless of the
             value of this parameter.  Mutable state.  Not even once.
+    :return: a function of one argument that returns its input (possibly modified, depending on
+        the value of ``coerce_data``) if the input is valid with the given schema, else throws
+        a ValueError.
+    """
+    validation_predicate = validation_predicate or _WHEN_DEBUGGING
+    if validation_predicate is _WHEN_DEBUGGING and not __debug__:
+        # validation is statically disabled under python -O: hand back a passthrough
+        return lambda data: data
+    compiled_schema = _get_compiled(schema)
+
+    def _validate(data):
+        if not validation_predicate():
+            return data
+        try:
+            coerced_and_validated_data = compiled_schema(data)
+            return coerced_and_validated_data if coerce_data else data
+        except Exception as e:
+            _raise_validation_error(subject_name_str, data, schema, e)
+    _validate.compiled_schema = compiled_schema
+    return _validate
+
+
+def validator(schema, subject_name_str, validation_predicate=None, coerce_data=False, data=None):
+    """Creates a validation function which conditionally applies validation and coercion to data
+
+    Thin backwards compatible wrapper around ``make_validator``, preserving the old curried
+    calling convention.
+
     :param data:
         The data which will ultimately be passed into the validator.
     :return:
@@ -141,20 +358,5 @@ def validator(schema, subject_name_str, validation_predicate=None, coerce_data=F
         * when data is supplied: returns data (possibly modified, depending on the value of ``coerce_data``) if the data
           is valid with the given schema, else throws a ValueError.
     """
-    if data is None:
-        return partial(validator, schema, subject_name_str, validation_predicate, coerce_data)
-    validation_predicate = validation_predicate or _WHEN_DEBUGGING
-    if not validation_predicate():
-        return data
-    try:
-        coerced_and_validated_data = validate_against_schema(schema, data)
-        return coerced_and_validated_data if coerce_data else data
-    except Exception as e:
-        message_details = {
-            "subject": subject_name_str,
-            "error": "{0}: {1}".format(e.__class__.__name__, e),
-            "value": data,
-            "schema": schema
-        }
-        raise ValueError("Bad value provided for {subject}. - error: {error} schema: {schema} value: {value}".format(
-            **message_details))
+    validate = make_validator(schema, subject_name_str, validation_predicate, coerce_data)
+    return validate if data is None else validate(data)
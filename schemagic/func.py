@@ -8,7 +8,8 @@ from schemagic.core import validate_against_schema, validator
 from schemagic.validators import date_string
 
 ALWAYS = lambda: True
-WHEN_DEBUGGING = lambda: __debug__
+# __debug__ is fixed at interpreter startup, so resolve it once instead of per call
+WHEN_DEBUGGING = (lambda: True) if __debug__ else (lambda: False)
 IDENTITY = lambda x: x
 
 
@@ -18,6 +19,9 @@ def validated(validation_predicate=None, coerce_data=True, input_schema=None, ou
         return partial(validated, validation_predicate, coerce_data, input_schema, output_schema)
 
     validation_predicate = validation_predicate or WHEN_DEBUGGING
+    if validation_predicate is WHEN_DEBUGGING and not __debug__:
+        # validation is statically disabled under python -O: the function needs no wrapping at all
+        return fn
     input_validator = validator(input_schema or IDENTITY, "input to function {0}".format(fn.__name__), validation_predicate=validation_predicate, coerce_data=coerce_data)
     output_validator = validator(output_schema or IDENTITY, "output from function {0}".format(fn.__name__), validation_predicate=validation_predicate, coerce_data=coerce_data)
 
@@ -28,18 +32,13 @@ def validated(validation_predicate=None, coerce_data=True, input_schema=None, ou
     return _fn
 
 def validate_function_input(input_validator, arg_list, kwarg_dict):
-    if arg_list and kwarg_dict:
-        validated_input = input_validator(arg_list + tuple([kwarg_dict]))
-        args, kwargs = validated_input[:-1], validated_input[-1]
-    elif kwarg_dict:
-        validated_input = input_validator(kwarg_dict)
-        args, kwargs = [], validated_input
-    elif arg_list and len(arg_list) > 1:
-        validated_input = input_validator(arg_list)
-        args, kwargs = validated_input, {}
-    elif arg_list and len(arg_list) is 1:
-        validated_input = input_validator(arg_list[0])
-        args, kwargs = [validated_input], {}
-    else:
-        args, kwargs = arg_list, kwarg_dict
-    return args, kwargs
\ No newline at end of file
+    if arg_list:
+        if kwarg_dict:
+            validated_input = input_validator(arg_list + (kwarg_dict,))
+            return validated_input[:-1], validated_input[-1]
+        if len(arg_list) == 1:
+            return [input_validator(arg_list[0])], {}
+        return input_validator(arg_list), {}
+    if kwarg_dict:
+        return [], input_validator(kwarg_dict)
+    return arg_list, kwarg_dict
\ No newline at end of file
@@ -1,13 +1,9 @@
-import copy
 import doctest
-import functools
 from contextlib import contextmanager
 from functools import wraps, update_wrapper, partial
 
 import operator
 
-import itertools
-
 
 def merge_with(fn, a, b):
     """ returns a new dictionary that is the merger of a and b.  applies fn to the values of colliding keys.
@@ -15,7 +11,7 @@ def merge_with(fn, a, b):
     >>> merge_with(operator.add, {"a": 1}, {"a": 1, "b": 1})
     {'a': 2, 'b': 1}
     """
-    fresh_dict = copy.deepcopy(a)
+    fresh_dict = dict(a)
     for k, v in b.items():
         if k in fresh_dict:
             fresh_dict[k] = fn(fresh_dict[k], v)
@@ -59,34 +55,31 @@ def multiple_dispatch_fn(dispatch_map, default=None):
     :param default: implementation fn to be used if none of the predicates are satisfied
     :return:
     """
-    dispatch_map = dispatch_map or {}
+    dispatch_pairs = list(dispatch_map.items()) if dispatch_map else []
     def _fn(*args, **kwargs):
-        try:
-            dispatch_fn = next(itertools.chain([value for key, value in dispatch_map.items() if key(*args, **kwargs)],
-                                               [default] if default else []))
-            return dispatch_fn(*args, **kwargs)
-        except StopIteration:
-            raise ValueError("No dispatch function found. args: {0}, kwargs: {1}".format(args, kwargs))
+        for predicate, implementation in dispatch_pairs:
+            if predicate(*args, **kwargs):
+                return implementation(*args, **kwargs)
+        if default is not None:
+            return default(*args, **kwargs)
+        raise ValueError("No dispatch function found. args: {0}, kwargs: {1}".format(args, kwargs))
     return _fn
 
-def remove_key(dict_, key):
-    del dict_[key]
-    return dict_
-
 def separate_dict(initial_dict, *keys_to_remove):
     """returns 2 new dicts, one with some keys removed, and another with only those keys"""
-    part1, part2 = copy.copy(initial_dict), {}
-    for key, val in part1.items():
-        if key in keys_to_remove:
-            part2[key] = val
+    keys_to_remove = frozenset(keys_to_remove)
+    part1, part2 = {}, {}
+    for key, val in initial_dict.items():
+        (part2 if key in keys_to_remove else part1)[key] = val
+    return part1, part2
 
-    return functools.reduce(remove_key, part2.keys(), part1), part2
+try:
+    _STRING_TYPES = (basestring,)
+except NameError:  # python 3 has no basestring
+    _STRING_TYPES = (str,)
 
 def is_string(obj):
-    try:
-        return isinstance(obj, basestring)
-    except NameError:
-        return isinstance(obj, str)
+    return isinstance(obj, _STRING_TYPES)
 
 @contextmanager
 def assert_raises(expected_error=None):
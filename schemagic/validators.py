@@ -1,5 +1,5 @@
 import re
-from functools import partial, update_wrapper
+from functools import update_wrapper
 
 from schemagic.core import validate_against_schema
 from schemagic.utils import merge
@@ -21,41 +21,80 @@ def predicate_validator(predicate, name=None, coercer=None, message=None, data=N
             values "filled in".  i.e. it returns a curried function.
         If the data is supplied, returns the, possibly transformed, data if it is valid, else throws an error.
     """
-    predicate.__name__ = name or predicate.__name__
-    if data is None:
-        return update_wrapper(partial(predicate_validator, predicate, name, coercer, message), predicate)
-    data = coercer(data) if coercer else data
-    message = (message or "data did not meet requirements of the predicate {0}".format(predicate.__name__)) + "\n value: {0}".format(data)
-    if not predicate(data):
-        raise ValueError(message)
-    return data
-
-formatted_string = lambda str_format, **kwargs: predicate_validator(
-    lambda data: re.match(str_format, data),
+    predicate_name = name or getattr(predicate, "__name__", "<predicate>")
+
+    def _validate_predicate(data):
+        data = coercer(data) if coercer else data
+        if not predicate(data):
+            raise ValueError(
+                (message or "data did not meet requirements of the predicate {0}".format(predicate_name))
+                + "\n value: {0}".format(data))
+        return data
+    update_wrapper(_validate_predicate, predicate)
+    _validate_predicate.__name__ = predicate_name
+    return _validate_predicate if data is None else _validate_predicate(data)
+
+formatted_string = lambda str_format, full_match=False, **kwargs: predicate_validator(
+    lambda data, _match=(re.compile(str_format).fullmatch if full_match else re.compile(str_format).match): _match(data),
     **merge(dict(name="formatted_string: {0}".format(str_format),
-                 coercer=str,
-                 message="string not of expected format: expected: {0}".format(format)),
+                 # skip the str() call for the common case of data that is already a string
+                 coercer=lambda data: data if type(data) is str else str(data),
+                 message="string not of expected format: expected: {0}".format(str_format)),
             kwargs))
-"""Stringifies the data, then matches it against the supplied regex string.  Valid if match is returned"""
+"""Stringifies the data, then matches it against the supplied regex string.  Valid if match is returned.
+Pass ``full_match=True`` to require the whole string to match rather than just its start."""
 
-#: ``formatted_string(r'\d+\-\d+\-\d+')``: checks to see if the data is of the type returned by stringifying a datetime.date object
-date_string = formatted_string(r'\d+\-\d+\-\d+')
+#: ``formatted_string(r'\d+\-\d+\-\d+', full_match=True)``: checks to see if the data is of the type returned by stringifying a datetime.date object
+date_string = formatted_string(r'\d+\-\d+\-\d+', full_match=True)
 
-#: ``formatted_string(r'\d+\-\d+\-\d+ \d+:\d+:\d+\.\d+')``: checks to see if the data is of the type returned by stringifying a datetime.datetime object
-datetime_string = formatted_string(r'\d+\-\d+\-\d+ \d+:\d+:\d+\.\d+')
+#: ``formatted_string(r'\d+\-\d+\-\d+ \d+:\d+:\d+\.\d+', full_match=True)``: checks to see if the data is of the type returned by stringifying a datetime.datetime object
+datetime_string = formatted_string(r'\d+\-\d+\-\d+ \d+:\d+:\d+\.\d+', full_match=True)
 
 #: ``predicate_validator``: Usually composed with or_, checks to see if the data is the value None
 null = predicate_validator(lambda val: val is None, name="null")
 
-or_ = lambda *schemata: predicate_validator(
+def _memoize_by_args(builder):
+    """Caches the built validator per argument tuple, so schemas constructed inline in hot code
+    (e.g. inside request handlers) reuse one predicate instead of reallocating it every call.
+    Unhashable arguments simply bypass the cache."""
+    cache = {}
+
+    def _cached_builder(*args):
+        try:
+            built = cache.get(args)
+        except TypeError:  # unhashable args can't be cached
+            return builder(*args)
+        if built is None:
+            built = cache[args] = builder(*args)
+        return built
+    return update_wrapper(_cached_builder, builder)
+
+
+or_ = _memoize_by_args(lambda *schemata: predicate_validator(
     lambda val: any(validate_against_schema(schema, val) for schema in schemata),
     name="any of schema's {0}".format(schemata),
-)
+))
 """checks to see if the data is valid with any of the given data definitions"""
 
 
-enum = lambda *possible_vals: predicate_validator(
-    lambda val: val in possible_vals,
+def _enum_membership(possible_vals):
+    """Builds the membership predicate for ``enum``, preferring an O(1) frozenset lookup over the
+    tuple scan whenever the allowed values are hashable."""
+    try:
+        allowed = frozenset(possible_vals)
+    except TypeError:  # unhashable allowed values - fall back to the linear scan
+        return lambda val: val in possible_vals
+
+    def _is_allowed(val):
+        try:
+            return val in allowed
+        except TypeError:  # unhashable data can't equal any hashable allowed value
+            return False
+    return _is_allowed
+
+
+enum = _memoize_by_args(lambda *possible_vals: predicate_validator(
+    _enum_membership(possible_vals),
     name="enumeration of allowable values: {0}".format(possible_vals),
-)
+))
 """checks to see if the data is one of the provided values"""
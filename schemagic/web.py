@@ -1,25 +1,62 @@
-import functools
-import simplejson as json
+from collections.abc import Sequence as _Sequence, MutableMapping as _MutableMapping
 from functools import partial, update_wrapper
-import collections
+
+# fastest importable json implementation wins.  orjson.dumps returns bytes, which Flask's
+# Response accepts directly, so no extra encode pass is needed on that path.  orjson rejects
+# non-str dict keys by default, which would break map-template output schemas like {int: str};
+# OPT_NON_STR_KEYS restores the key stringification the other implementations do.
+try:
+    import orjson as _json
+    _json_loads = _json.loads
+    _json_dumps = lambda data, _dumps=_json.dumps, _opts=_json.OPT_NON_STR_KEYS: _dumps(data, option=_opts)
+except ImportError:
+    try:
+        import ujson as _json
+        _json_loads, _json_dumps = _json.loads, _json.dumps
+    except ImportError:
+        try:
+            import simplejson as _json
+        except ImportError:
+            import json as _json
+        _json_loads, _json_dumps = _json.loads, _json.dumps
 
 from flask.globals import request
 from flask.wrappers import Response
 
-from schemagic.core import validate_against_schema, validator
+from schemagic.core import validator
 from schemagic.utils import multiple_dispatch_fn, is_string
 
 _ALWAYS = lambda: True
-_WHEN_DEBUGGING = lambda: __debug__
+# __debug__ is fixed at interpreter startup, so resolve it once instead of per call
+_WHEN_DEBUGGING = (lambda: True) if __debug__ else (lambda: False)
 _IDENTITY = lambda x: x
 
+# predicate order matters here: python 3 strings satisfy the Sequence ABC, so the string check
+# must run before the sequence check or string arguments would be splatted character by character.
+# concrete str/bytes arguments never reach this table - _DISPATCH_BY_TYPE below catches them first.
 _dispatch_to_fn = multiple_dispatch_fn({
     lambda fn, args: is_string(args): lambda fn, arg_list: fn(arg_list),
-    lambda fn, args: isinstance(args, collections.Sequence): lambda fn, arg_list: fn(*arg_list),
-    lambda fn, args: isinstance(args, collections.MutableMapping): lambda fn, arg_list: fn(**arg_list)},
+    lambda fn, args: isinstance(args, _Sequence): lambda fn, arg_list: fn(*arg_list),
+    lambda fn, args: isinstance(args, _MutableMapping): lambda fn, arg_list: fn(**arg_list)},
     default=lambda fn, arg_list: fn(arg_list)
 )
-dispatch_to_fn = lambda fn, args: _dispatch_to_fn(fn, args)
+
+#: concrete-type fast table for dispatch_to_fn - rehydrated json is always one of these types,
+#: so the per-request predicate scan only runs for exotic containers.
+_DISPATCH_BY_TYPE = {
+    str: lambda fn, arg: fn(arg),
+    bytes: lambda fn, arg: fn(arg),
+    list: lambda fn, arg_list: fn(*arg_list),
+    tuple: lambda fn, arg_list: fn(*arg_list),
+    dict: lambda fn, kwarg_dict: fn(**kwarg_dict),
+}
+
+
+def dispatch_to_fn(fn, args):
+    handler = _DISPATCH_BY_TYPE.get(type(args))
+    if handler is not None:
+        return handler(fn, args)
+    return _dispatch_to_fn(fn, args)
 dispatch_to_fn.__doc__ = \
     """Dispatches a json object to a function.  The way the data is applied depends on the structure of the data.
         * if the data is a sequence, it will unpack it and pass each item into the function, i.e. it will use ``*args``
@@ -45,13 +82,14 @@ def _process_error(exception):
     :param exception: The Exception which occured as a part of processing the request
     :return: a flask Response that more specifically identifies the cause of the problem.
     """
-    if "input" in exception.args[0]:
+    message = exception.args[0] if exception.args else ""
+    if is_string(message) and "input" in message:
         return Response(
-            response=exception,
+            response=str(exception),
             status=400)
     return Response(
         status=500,
-        response=exception)
+        response=str(exception))
 
 
 def webservice_fn(fn, input_validator, output_validator):
@@ -63,16 +101,15 @@ def webservice_fn(fn, input_validator, output_validator):
     :return: a json Flask Response that contains either the requested data or an error.
     """
     try:
+        data = _json_loads(request.get_data(cache=False))
+        data = input_validator(data)
+        data = dispatch_to_fn(fn, data)
+        data = output_validator(data)
         return Response(
-            response= functools.reduce(lambda x, y: y(x),[
-                json.loads,
-                partial(validate_against_schema, input_validator),
-                partial(dispatch_to_fn, fn),
-                partial(validate_against_schema, output_validator),
-                json.dumps
-            ], request.data),
+            response=_json_dumps(data),
             status=200,
-            mimetype="application/json"
+            mimetype="application/json",
+            direct_passthrough=True
         )
     except Exception as e:
         return _process_error(e)
@@ -116,18 +153,58 @@ def service_route(service, validation_pred=None, coerce_data=True, rule=None, in
     :return: the original function, unmodified.
     """
     if not rule:
-        return update_wrapper(partial(service_route, service, validation_pred, coerce_data), service_route)
+        def _service_route(**route_kwargs):
+            return service_route(service, validation_pred, coerce_data, **route_kwargs)
+        return update_wrapper(_service_route, service_route)
     if fn is None:
-        return update_wrapper(partial(service_route, service, validation_pred, coerce_data, rule, input_schema, output_schema), service_route)
+        def _register(fn):
+            return service_route(service, validation_pred, coerce_data, rule, input_schema, output_schema, fn)
+        return update_wrapper(_register, service_route)
 
     validation_pred = validation_pred or _WHEN_DEBUGGING
-    input_validator = validator(input_schema or _IDENTITY, "input to endpoint {0}".format(rule), validation_predicate=validation_pred, coerce_data=coerce_data)
-    output_validator = validator(output_schema or _IDENTITY, "output from endpoint {0}".format(rule), validation_predicate=validation_pred, coerce_data=coerce_data)
+    if validation_pred is _WHEN_DEBUGGING and not __debug__:
+        # validation is statically disabled under python -O: build a view with no validation
+        # steps at all rather than funnelling every request through identity validators
+        def _view_fn(_loads=_json_loads, _dumps=_json_dumps, _dispatch=dispatch_to_fn, _fn=fn):
+            try:
+                data = _dispatch(_fn, _loads(request.get_data(cache=False)))
+                return Response(
+                    response=_dumps(data),
+                    status=200,
+                    mimetype="application/json",
+                    direct_passthrough=True
+                )
+            except Exception as e:
+                return _process_error(e)
+    else:
+        # schemaless sides skip validator construction outright - the identity lambda is the
+        # whole per-request cost, instead of a predicate call and dispatch through a validator
+        input_validator = _IDENTITY if not input_schema else validator(input_schema, "input to endpoint {0}".format(rule), validation_predicate=validation_pred, coerce_data=coerce_data)
+        output_validator = _IDENTITY if not output_schema else validator(output_schema, "output from endpoint {0}".format(rule), validation_predicate=validation_pred, coerce_data=coerce_data)
+
+        # the request pipeline is baked into a specialized view closure at registration time.
+        # binding the pipeline callables as default arguments turns their per-request
+        # module-global lookups into local loads.
+        def _view_fn(_loads=_json_loads, _dumps=_json_dumps, _dispatch=dispatch_to_fn, _fn=fn,
+                     _input_validator=input_validator, _output_validator=output_validator):
+            try:
+                data = _loads(request.get_data(cache=False))
+                data = _input_validator(data)
+                data = _dispatch(_fn, data)
+                data = _output_validator(data)
+                return Response(
+                    response=_dumps(data),
+                    status=200,
+                    mimetype="application/json",
+                    direct_passthrough=True
+                )
+            except Exception as e:
+                return _process_error(e)
 
     service.add_url_rule(
         rule=rule,
-        endpoint=fn.__name__ if hasattr(fn, "__name__") else rule,
-        view_func=update_wrapper(lambda: webservice_fn(fn, input_validator, output_validator), fn),
+        endpoint=getattr(fn, "__name__", rule),
+        view_func=update_wrapper(_view_fn, fn),
         methods=['POST']
     )
     return fn
@@ -145,4 +222,5 @@ def service_registry(service, validation_pred=None, coerce_data=True, *service_d
     """
     if not service_definitions:
         return update_wrapper(partial(service_registry, service, validation_pred, coerce_data), service_registry)
-    list(map(lambda definition: service_route(service, validation_pred, coerce_data, **definition), service_definitions))
\ No newline at end of file
+    for definition in service_definitions:
+        service_route(service, validation_pred, coerce_data, **definition)
\ No newline at end of file
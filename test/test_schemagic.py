@@ -1,14 +1,22 @@
-from collections import defaultdict
+import json
+from collections import namedtuple
 from pprint import pprint
-from unittest.case import TestCase
 from flask import Flask
-import itertools
+import pytest
 
-from schemagic.core import validate_against_schema
-from schemagic.utils import separate_dict
+from schemagic.core import compile_schema, validate_against_schema, validate_keyed_mapping
 from schemagic.validators import formatted_string, null, or_, enum
 from schemagic.web import service_registry
 
+#: shared no-op post_process - one function object for every row that doesn't declare its own.
+_IDENTITY = lambda x: x
+
+#: bound once at import - formatted_string compiles its regex at curry time, so naming the
+#: validator here guarantees a single compile for the whole test run.
+digit_string = formatted_string(r"\d+")
+int_or_float = or_(int, float)
+hello_or_five = enum("Hello", 5)
+
 test_cases = {
     validate_against_schema: {
         "showing an error when given int instead of list of ints":
@@ -43,7 +51,7 @@ test_cases = {
                  post_process=list,
                  result=ValueError),
     },
-    formatted_string(r"\d+"):{
+    digit_string:{
         "throwing error when incorrectly formatted string passed as data":
             dict(data="not a digit",
                  result=ValueError
@@ -60,7 +68,7 @@ test_cases = {
             dict(data="hello",
                  result=ValueError)
     },
-    or_(int, float):{
+    int_or_float:{
         "allowing ints":
             dict(data=10,
                  result=10),
@@ -71,7 +79,7 @@ test_cases = {
             dict(data="hello",
                  result=ValueError)
     },
-    enum("Hello", 5):{
+    hello_or_five:{
         "allowing string \"Hello\"": dict(data="Hello", result="Hello"),
         "allowing int 5": dict(data=5, result=5),
         "rejecting int 6": dict(data=6, result=ValueError),
@@ -79,56 +87,120 @@ test_cases = {
     }
 }
 
-def capture_errors(fn_with_possible_errors):
+def run_tests(test_cases):
+    """Streams one (fn name, motivation, outcome) triple per test row.  Yielding rather than
+    accumulating a results dict keeps the standalone harness at constant memory per case, and an
+    explicit loop in ``__main__`` prints eagerly - a lazy ``map(pprint, ...)`` would be silently
+    discarded on python 3."""
+    for test_fn, test_definitions in test_cases.items():
+        test_fn_name = test_fn.__name__
+        for test_motivation, test_definition in test_definitions.items():
+            test_kwargs = {key: val for key, val in test_definition.items() if key not in ("result", "post_process")}
+            expected_result = test_definition["result"]
+            post_process = test_definition.get("post_process", _IDENTITY)
+            try:
+                test_result = post_process(test_fn(**test_kwargs))
+            except Exception as e:
+                test_result = e.__class__
+            yield test_fn_name, test_motivation, (test_result == expected_result or "Not {0} as expected. expected: {1} got: {2}".format(test_motivation, expected_result, test_result))
+
+def _flatten_case(test_fn, test_motivation, test_definition):
+    """Builds one CASES row.  Container schemas under ``validate_against_schema`` are compiled
+    once here, so the parametrized runs exercise the emitted checker directly instead of
+    re-walking the schema on every call.  Leaf schemas compile to themselves and keep the
+    ``validate_against_schema`` entry point."""
+    test_kwargs = {key: val for key, val in test_definition.items() if key not in ("result", "post_process")}
+    if test_fn is validate_against_schema:
+        compiled_schema = compile_schema(test_kwargs["schema"])
+        if compiled_schema is not test_kwargs["schema"]:
+            test_fn = compiled_schema
+            test_kwargs = {"value": test_kwargs["value"]}
+    return Case(test_fn,
+                test_motivation,
+                test_kwargs,
+                test_definition["result"],
+                test_definition.get("post_process", _IDENTITY))
+
+Case = namedtuple("Case", ["test_fn", "test_motivation", "test_kwargs", "expected_result", "post_process"])
+
+#: ``test_cases`` flattened once at import into an immutable tuple of Case rows, so each row
+#: becomes its own parametrized test and repeated collection iterates read-only records.
+CASES = tuple(
+    _flatten_case(test_fn, test_motivation, test_definition)
+    for test_fn, test_definitions in test_cases.items()
+    for test_motivation, test_definition in test_definitions.items())
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.test_motivation)
+def test_case(case):
+    test_fn, test_motivation, test_kwargs, expected_result, post_process = case
     try:
-        return fn_with_possible_errors()
+        test_result = post_process(test_fn(**test_kwargs))
     except Exception as e:
-        return e.__class__
+        test_result = e.__class__
+    assert test_result == expected_result, "Not {0} as expected. expected: {1} got: {2}".format(test_motivation, expected_result, test_result)
 
 
-def run_tests(test_cases):
-    test_results = defaultdict(list)
-    for test_fn, test_definitions in test_cases.items():
-        for test_motivation, test_definition in test_definitions.items():
-            split_out_test_parameters = separate_dict(test_definition, "result", "post_process")
-            test_kwargs, expected_result, post_process = split_out_test_parameters[0], split_out_test_parameters[1]["result"], split_out_test_parameters[1].get("post_process", lambda x: x)
-            test_result = capture_errors(lambda: post_process(test_fn(**test_kwargs)))
-            test_results[test_fn.__name__].append(test_result == expected_result or "Not {0} as expected. expected: {1} got: {2}".format(test_motivation, expected_result, test_result))
-    return test_results
-
-class SchemagicTests(TestCase):
-    def test_all_test_cases_passing(self):
-        test_results = run_tests(test_cases)
-        if not all(result is True for result in itertools.chain.from_iterable(test_results.values())):
-            self.fail(test_results)
-
-class SchemagicWebTest(TestCase):
-    def setUp(self):
-        test_app = Flask("testing")
-
-        test_app.config['TESTING'] = True
-        self.app = test_app
-        self.test_client = test_app.test_client()
-
-    def test_normal_flask_routing(self):
-        self.app.add_url_rule("/", view_func=lambda: "Hello")
-        self.test_client.get('/')
-
-    def test_service_registry(self):
-        register_test_services = service_registry(self.app)
-        register_test_services(
-            dict(rule="/new-route",
-                 input_schema=[int],
-                 output_schema=int,
-                 fn=lambda *args: sum(args)
-            )
+def test_compiled_missing_keys_message_matches_interpreted():
+    """The compiled and interpreted keyed-mapping paths must report missing keys identically,
+    otherwise which path happened to run leaks into the error the caller sees."""
+    schema = {"a": int, "b": int}
+    with pytest.raises(ValueError) as compiled_error:
+        compile_schema(schema)({"a": 1})
+    with pytest.raises(ValueError) as interpreted_error:
+        validate_keyed_mapping(schema, {"a": 1})
+    assert str(compiled_error.value) == str(interpreted_error.value) == "Missing keys {'b'} for value {'a': 1}"
+
+
+@pytest.fixture(scope="module")
+def web_client():
+    """One Flask app and test client shared by every web test in the module - app construction
+    and the werkzeug routing table are built once instead of per test.  Each test gets its own
+    url rule, all registered up front because flask freezes routing at the first request."""
+    test_app = Flask("testing")
+    test_app.config['TESTING'] = True
+    test_app.add_url_rule("/", endpoint="hello", view_func=lambda: "Hello")
+    register_test_services = service_registry(test_app)
+
+    def int_keyed_mapping():
+        return {1: "hello", 2: "world"}
+    register_test_services(
+        dict(rule="/new-route",
+             input_schema=[int],
+             output_schema=int,
+             fn=lambda *args: sum(args)
+        ),
+        dict(rule="/int-keyed-route",
+             output_schema={int: str},
+             fn=int_keyed_mapping
         )
-        bad_request = self.test_client.get("/new-route")
-        self.assertEqual(bad_request._status_code, 405)
+    )
+    yield test_app.test_client()
+
+
+def test_normal_flask_routing(web_client):
+    web_client.get('/')
+
+
+def test_service_registry(web_client):
+    bad_request = web_client.get("/new-route")
+    assert bad_request.status_code == 405
+
+    good_request = web_client.post("/new-route", data="[1, 2]")
+    assert good_request.status_code == 200
+    assert good_request.data == b"3"
+
+    bad_schema_request = web_client.post("/new-route", data='["Not an Int"]')
+    assert bad_schema_request.status_code == 400
+
 
-        good_request = self.test_client.post("/new-route", data="[1, 2]")
-        self.assertEqual(good_request._status_code, 200)
-        self.assertEqual(int(good_request.data), 3)
+def test_non_str_keyed_output_schema(web_client):
+    """Every tier of the json shim must stringify non-str dict keys the way simplejson and the
+    stdlib do, so a map-template output schema like {int: str} serializes instead of erroring."""
+    int_keyed_request = web_client.post("/int-keyed-route", data="[]")
+    assert int_keyed_request.status_code == 200
+    assert json.loads(int_keyed_request.data) == {"1": "hello", "2": "world"}
 
-        bad_schema_request = self.test_client.post("/new-route", data='["Not an Int"]')
-        self.assertEqual(bad_schema_request._status_code, 400)
\ No newline at end of file
+if __name__ == '__main__':
+    for test_outcome in run_tests(test_cases):
+        pprint(test_outcome)
\ No newline at end of file